@@ -6,18 +6,29 @@ need for each application to write their own code to run tasks. Leave all of
 this work up to blaster and just provide the classes and methods you would
 like to run.
 """
+import asyncio
 import multiprocessing
 import queue
 import signal
 import sys
+import threading
 import time
 import traceback
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
+from typing import Deque
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Set
+from typing import Sized
 from typing import Union
 
+from blaster.constants import *
 from blaster.core import *
 from blaster.metadata import __version__
 
@@ -49,118 +60,386 @@ class Worker(LoggerMixin):
         :param serial: whether this method is being run concurrently or
             sequentially
         """
-        # Controls if remaining tasks in the queue should be flushed out
-        flush_queue: bool = False
+        for _ in self.iter_run(task_queue, task_complete_queue, serial):
+            pass
+
+    def iter_run(
+        self,
+        task_queue: Union[queue.Queue, multiprocessing.Queue],
+        task_complete_queue: Union[queue.Queue, multiprocessing.Queue],
+        serial: bool,
+    ) -> Iterator[None]:
+        """Process the tasks methods from the given queues one at a time.
+
+        Yields each time a processed task is put on the completion queue.
+
+        :param task_queue: the queue containing the tasks to process.
+        :param task_complete_queue: the queue containing updated tasks that
+            have been or failed to fully process
+        :param serial: whether this method is being run concurrently or
+            sequentially
+        """
+        for task in iter(task_queue.get, "STOP"):
+            # Holds the type of exception thrown
+            exception_type: str = self.process_task(task)
+            task_complete_queue.put(task)
+            yield
+
+            # Break out of the loop and flush out remaining tasks in the queue
+            #  - expr_1 = parallel mode
+            #  - expr_2 = sequential mode
+            expr_1 = exception_type == "keyboardinterrupt" and not serial
+            expr_2 = bool(exception_type) and serial
+            if expr_1 or expr_2:
+                time.sleep(1)
+                self.flush(task_queue, task_complete_queue)
+                yield
+                break
+
+            if serial and task_queue.qsize() == 0:
+                break
+
+    async def run_async(
+        self, task_queue: queue.Queue, task_complete_queue: queue.Queue
+    ) -> None:
+        """Process the tasks methods from the given queues within an event loop.
+
+        Coroutine task methods are awaited directly, any other task methods
+        are run in a thread to not block the event loop.
+
+        :param task_queue: the queue containing the tasks to process.
+        :param task_complete_queue: the queue containing updated tasks that
+            have been or failed to fully process
+        """
+        while True:
+            try:
+                task = task_queue.get_nowait()
+            except queue.Empty:
+                # Tasks may still be fed into the queue
+                await asyncio.sleep(0.01)
+                continue
+            if task == "STOP":
+                break
+
+            exception_type: str = await self.process_task_async(task)
+            task_complete_queue.put(task)
+
+            if exception_type == "keyboardinterrupt":
+                self.flush(task_queue, task_complete_queue)
+                break
+
+    def process_task(self, task: Dict[str, Any]) -> str:
+        """Process all methods for the given task, updating it with results.
+
+        :param task: the task to process
+        :return: name of the exception raised (empty when none was raised)
+        """
+        self.logger.debug("Processing task: %s" % task["name"])
+
+        # Instantiate task class
+        task_obj = task["task"](**task)
+
+        # Get the task timeout
+        timeout = task.pop("timeout", None)
+
+        # Signals can only be handled by the main thread
+        if timeout and threading.current_thread() is not threading.main_thread():
+            self.logger.warning(
+                "Task: %s timeout is ignored when not run in the main thread."
+                % task["name"]
+            )
+            timeout = None
+
+        # A list holding all methods processed with their results
+        methods: List[Dict[str, Any]] = []
 
         # Holds the type of exception thrown
         exception_type: str = ""
 
-        for task in iter(task_queue.get, "STOP"):
-            self.logger.debug("Processing task: %s" % task["name"])
+        def timeout_handler(signum, frame) -> None:
+            """Timeout handler."""
+            raise RuntimeError(
+                f"Task: {task['name']}, method: {method}, reached timeout!"
+            )
 
-            # Instantiate task class
-            task_obj = task["task"](**task)
+        # Loop through and run all task methods
+        for index, method in enumerate(task["methods"]):
+            self.logger.debug("Running method %s" % method)
 
-            # Get the task timeout
-            timeout = task.pop("timeout", None)
+            try:
+                # Set task alarm timeout if supplied
+                if timeout:
+                    signal.signal(signal.SIGALRM, timeout_handler)
+                    signal.alarm(timeout)
 
-            # A list holding all methods processed with their results
-            methods: List[Dict[str, Any]] = []
+                # Run the task method
+                value = getattr(task_obj, method)()
 
-            def timeout_handler(signum, frame) -> None:
-                """Timeout handler."""
-                raise RuntimeError(
-                    f"Task: {task['name']}, method: {method}, reached timeout!"
-                )
+                self.method_passed(task, methods, method, value)
+            except (Exception, KeyboardInterrupt) as e:
+                exception_type = self.method_failed(task, methods, index, e)
+                break
+            finally:
+                # Reset the alarm if timeout was supplied
+                if timeout:
+                    signal.alarm(0)
 
-            # Loop through and run all task methods
-            for index, method in enumerate(task["methods"]):
-                self.logger.debug("Running method %s" % method)
+        task["methods"] = methods
+        return exception_type
 
+    async def process_task_async(self, task: Dict[str, Any]) -> str:
+        """Process all methods for the given task within an event loop.
+
+        :param task: the task to process
+        :return: name of the exception raised (empty when none was raised)
+        """
+        self.logger.debug("Processing task: %s" % task["name"])
+
+        # Instantiate task class
+        task_obj = task["task"](**task)
+
+        # Get the task timeout
+        timeout = task.pop("timeout", None)
+
+        # A list holding all methods processed with their results
+        methods: List[Dict[str, Any]] = []
+
+        # Holds the type of exception thrown
+        exception_type: str = ""
+
+        # Loop through and run all task methods
+        for index, method in enumerate(task["methods"]):
+            self.logger.debug("Running method %s" % method)
+
+            try:
+                func = getattr(task_obj, method)
+                if asyncio.iscoroutinefunction(func):
+                    coro = func()
+                else:
+                    coro = asyncio.to_thread(func)
+
+                # Run the task method
                 try:
-                    # Set task alarm timeout if supplied
-                    if timeout:
-                        signal.signal(signal.SIGALRM, timeout_handler)
-                        signal.alarm(timeout)
-
-                    # Run the task method
-                    value = getattr(task_obj, method)()
-
-                    # Set the tasks method results
-                    methods.append({"name": method, "status": 0, "rvalue": value})
-                    task["status"] = 0
-                except (Exception, KeyboardInterrupt) as e:
-                    self.logger.error(
-                        "A exception was raised while processing task: %s "
-                        "method: %s" % (task["name"], method)
-                    )
-                    task["status"] = 1
-
-                    # Get stack trace
-                    stack_trace: tuple = self.get_traceback()
-
-                    # Set the tasks method results
-                    methods.append(
-                        {
-                            "name": method,
-                            "status": 1,
-                            "rvalue": None,
-                            "traceback": traceback.format_tb(stack_trace[2]),
-                        }
+                    value = await asyncio.wait_for(coro, timeout or None)
+                except asyncio.TimeoutError:
+                    raise RuntimeError(
+                        f"Task: {task['name']}, method: {method}, reached timeout!"
                     )
 
-                    # Set the remaining method results since they were not
-                    # able to run
-                    for item in task["methods"][index + 1 :]:
-                        methods.append({"name": item, "status": "n/a", "rvalue": None})
+                self.method_passed(task, methods, method, value)
+            except (Exception, KeyboardInterrupt) as e:
+                exception_type = self.method_failed(task, methods, index, e)
+                break
 
-                    # Since a failure happened, we need to flush out the queue
-                    flush_queue = True
+        task["methods"] = methods
+        return exception_type
 
-                    # Save the name of the exception thrown
-                    exception_type = str(type(e).__name__).lower()
-                    break
-                finally:
-                    # Reset the alarm if timeout was supplied
-                    if timeout:
-                        signal.alarm(0)
+    @staticmethod
+    def method_passed(
+        task: Dict[str, Any], methods: List[Dict[str, Any]], method: str, value: Any
+    ) -> None:
+        """Record the results of a task method that passed.
 
-            task["methods"] = methods
-            task_complete_queue.put(task)
+        :param task: the task processed
+        :param methods: the methods processed with their results
+        :param method: the name of the method
+        :param value: the value returned by the method
+        """
+        # Set the tasks method results
+        methods.append({"name": method, "status": 0, "rvalue": value})
+        task["status"] = 0
 
-            # Break out of the loop and flush out remaining tasks in the queue
-            #  - expr_1 = parallel mode
-            #  - expr_2 = sequential mode
-            expr_1 = (
-                flush_queue and exception_type == "keyboardinterrupt" and not serial
-            )
-            expr_2 = flush_queue and serial
-            if expr_1 or expr_2:
-                time.sleep(1)
-                # Flush out remaining tasks in the queue
-                while not task_queue.empty():
-                    task = task_queue.get()
-                    if task == "STOP":
-                        break
-                    methods = task.pop("methods")
-                    _methods = []
-                    for method in methods:
-                        _methods.append(
-                            {"name": method, "status": "n/a", "rvalue": None}
-                        )
-                    task["status"] = "n/a"
-                    task["methods"] = _methods
-                    task_complete_queue.put(task)
-                break
+    def method_failed(
+        self,
+        task: Dict[str, Any],
+        methods: List[Dict[str, Any]],
+        index: int,
+        exception: BaseException,
+    ) -> str:
+        """Record the results of a task method that raised an exception.
+
+        Must be called while handling the exception raised.
+
+        :param task: the task processed
+        :param methods: the methods processed with their results
+        :param index: the index of the method within the tasks methods
+        :param exception: the exception raised
+        :return: name of the exception raised
+        """
+        self.logger.error(
+            "A exception was raised while processing task: %s "
+            "method: %s" % (task["name"], task["methods"][index])
+        )
+        task["status"] = 1
+
+        # Get stack trace
+        stack_trace: tuple = self.get_traceback()
 
-            if (serial and task_queue.qsize() == 0) or expr_1:
+        # Set the tasks method results
+        methods.append(
+            {
+                "name": task["methods"][index],
+                "status": 1,
+                "rvalue": None,
+                "traceback": traceback.format_tb(stack_trace[2]),
+            }
+        )
+
+        # Set the remaining method results since they were not able to run
+        for item in task["methods"][index + 1 :]:
+            methods.append({"name": item, "status": "n/a", "rvalue": None})
+
+        # Save the name of the exception thrown
+        return str(type(exception).__name__).lower()
+
+    @staticmethod
+    def flush(
+        task_queue: Union[queue.Queue, multiprocessing.Queue],
+        task_complete_queue: Union[queue.Queue, multiprocessing.Queue],
+    ) -> None:
+        """Flush out remaining tasks in the queue marking them as not run.
+
+        :param task_queue: the queue containing the tasks to flush
+        :param task_complete_queue: the queue to put the flushed tasks on
+        """
+        while not task_queue.empty():
+            task = task_queue.get()
+            if task == "STOP":
                 break
+            task_complete_queue.put(Worker.skip_task(task))
+
+    @staticmethod
+    def skip_task(task: Dict[str, Any]) -> Dict[str, Any]:
+        """Mark the given task and all of its methods as not run.
+
+        :param task: the task to skip
+        :return: the skipped task
+        """
+        methods = task.pop("methods")
+        _methods = []
+        for method in methods:
+            _methods.append({"name": method, "status": "n/a", "rvalue": None})
+        task["status"] = "n/a"
+        task["methods"] = _methods
+        return task
+
+
+class TaskFeeder(LoggerMixin):
+    """Feeds tasks from any iterable into a task queue from a thread.
+
+    When the task queue is bounded, the feeder blocks until workers make room
+    for more tasks. Keeping only the tasks in flight in memory.
+    """
+
+    def __init__(
+        self,
+        tasks: Iterable[Dict[str, Any]],
+        task_queue: Union[queue.Queue, multiprocessing.Queue],
+        stops: int = 0,
+        ordered: bool = False,
+    ) -> None:
+        """Constructor.
+
+        :param tasks: tasks to be fed
+        :param task_queue: the queue to feed the tasks into
+        :param stops: number of stop items to feed once all tasks are fed
+        :param ordered: whether to keep the order of the tasks fed
+        """
+        self.tasks: Iterable[Dict[str, Any]] = tasks
+        self.task_queue: Union[queue.Queue, multiprocessing.Queue] = task_queue
+        self.stops: int = stops
+
+        # Blaster ids of the tasks fed and not yet received back
+        self.pending: Set[str] = set()
+
+        # Blaster ids of the tasks in the order fed (when ordered)
+        self.order: Optional[Deque[str]] = deque() if ordered else None
+
+        self.count: int = 0
+        self.error: Optional[Exception] = None
+        self._done: threading.Event = threading.Event()
+        self._cancel: threading.Event = threading.Event()
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run, name="blaster-feeder", daemon=True
+        )
+
+    def start(self) -> "TaskFeeder":
+        """Start feeding the tasks."""
+        self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        """Stop feeding any more tasks."""
+        self._cancel.set()
+
+    def received(self, task: Dict[str, Any]) -> None:
+        """Mark the given fed task as received back from the workers.
+
+        :param task: the processed task
+        """
+        self.pending.discard(task["bid"])
+
+    def finished(self) -> bool:
+        """Return whether all tasks were fed and received back.
+
+        Raises the error hit while feeding tasks (e.g. invalid task).
+        """
+        if self.error is not None:
+            raise self.error
+        return self._done.is_set() and not self.pending
+
+    def _put(self, item: Union[str, Dict[str, Any]]) -> bool:
+        """Put the item on the task queue, waiting while the queue is full.
+
+        :param item: item to put on the queue
+        :return: whether the item was put (false when cancelled)
+        """
+        while not self._cancel.is_set():
+            try:
+                self.task_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self) -> None:
+        """Feed the tasks into the task queue."""
+        try:
+            self.logger.info("Tasks:")
+            for index, task in enumerate(self.tasks, start=1):
+                task = TaskDefinition(task)  # type: ignore
+                self.logger.info(
+                    """%s. Task     : %s
+                                Class    : %s
+                                Methods  : %s"""
+                    % (index, task["name"], task["task"], task["methods"])
+                )
+                self.pending.add(task["bid"])
+                if self.order is not None:
+                    self.order.append(task["bid"])
+                if not self._put(task):
+                    return
+                self.count += 1
+        except Exception as e:
+            self.error = e
+        finally:
+            for i in range(self.stops):
+                if not self._put("STOP"):
+                    break
+            self._done.set()
 
 
 class Blaster(CalcTimeMixin, LoggerMixin):
     """Blaster class."""
 
-    def __init__(self, tasks: List[Dict[str, Any]], log_level: str = "info") -> None:
+    def __init__(
+        self,
+        tasks: Optional[Iterable[Dict[str, Any]]] = None,
+        log_level: str = "info",
+        processes: Optional[Union[int, str]] = None,
+        max_processes: Optional[int] = None,
+        queue_size: Optional[int] = None,
+    ) -> None:
         """Constructor.
 
         Responsible for initializing attributes and performing any base
@@ -168,8 +447,30 @@ class Blaster(CalcTimeMixin, LoggerMixin):
 
         :param tasks: list of tasks to be processed
         :param log_level: logging level to be used when logging messages
+        :param processes: worker process sizing policy, either an explicit
+            number of processes, 'cpu' to use one process per available cpu
+            or 'autoscale' to grow the processes based on the task backlog
+            (defaults to up to 10 processes)
+        :param max_processes: upper limit of processes when autoscaling
+        :param queue_size: maximum number of tasks waiting in the task queue,
+            feeding more tasks waits until workers make room (defaults to
+            twice the number of workers)
         """
-        self.tasks: List[Dict[str, Any]] = tasks
+        self.tasks: Iterable[Dict[str, Any]] = tasks if tasks is not None else []
+
+        if isinstance(processes, str) and processes not in PROCESS_POLICIES:
+            raise BlasterError(
+                f"Invalid processes policy: '{processes}', choose from: "
+                f"{PROCESS_POLICIES}"
+            )
+        if isinstance(processes, int) and processes < 1:
+            raise BlasterError("Processes must be a positive number.")
+        self.processes: Optional[Union[int, str]] = processes
+        self.max_processes: int = max_processes or (
+            available_cpus() * AUTOSCALE_FACTOR
+        )
+        self._last_backlog: Optional[int] = None
+        self.queue_size: Optional[int] = queue_size
 
         # Set place holder attributes for queues
         self.task_queue: Union[queue.Queue, multiprocessing.Queue]
@@ -177,43 +478,259 @@ class Blaster(CalcTimeMixin, LoggerMixin):
 
         self.results: ResultsList = ResultsList()
 
+        # Persistent worker pool state (see start/shutdown)
+        self._processes: List[multiprocessing.Process] = []
+        self._pool_task_queue: Optional[multiprocessing.Queue] = None
+        self._pool_complete_queue: Optional[multiprocessing.Queue] = None
+        self._pool_pending: Dict[str, Dict[str, Any]] = {}
+        self._pool_lock: threading.Lock = threading.Lock()
+
         # Configure blasters logger
         self.create_blaster_logger(log_level.lower())
 
+    def __enter__(self) -> "Blaster":
+        """Start the persistent worker pool when entering a with block."""
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        """Shutdown the persistent worker pool when leaving a with block."""
+        self.shutdown()
+
+    @property
+    def running(self) -> bool:
+        """Return whether the persistent worker pool is running."""
+        return bool(self._processes)
+
+    def policy_processes(self) -> int:
+        """Return the number of worker processes given by the sizing policy."""
+        if isinstance(self.processes, int):
+            return self.processes
+        elif self.processes == "cpu":
+            return available_cpus()
+        elif self.processes == "autoscale":
+            # Start small, workers are added as the task backlog builds up
+            return 1
+        return DEFAULT_PROCESSES
+
     def total_processes(self) -> int:
         """Return the total number of worker processes to use."""
-        count: int = 10
-        total_tasks: int = len(self.tasks)
-        if total_tasks < 10:
-            count = total_tasks
+        count: int = self.policy_processes()
+        if isinstance(self.tasks, Sized):
+            count = min(count, len(self.tasks))
         self.logger.debug(f"Processor count: {count}")
         return count
 
-    def blastoff(
-        self, serial: bool = False, raise_on_failure: bool = False
-    ) -> List[Dict[str, int]]:
-        """Blast off tasks concurrently or sequentially calling their defined
-                methods.
+    def total_queue_size(self, workers: int) -> int:
+        """Return the maximum number of tasks waiting in the task queue.
 
-        :param serial: whether to run tasks sequentially
-        :param raise_on_failure: whether to raise exception on failure
-        :return: content from task method calls
+        :param workers: number of workers processing the queue
         """
-        self.logger.info("--> Blaster v%s <--" % __version__)
-        self.logger.info(
-            "Task Execution: %s" % ("Sequential" if serial else "Concurrent")
+        if self.queue_size is not None:
+            return self.queue_size
+        if self.processes == "autoscale":
+            workers = self.max_processes
+        return max(1, workers * QUEUE_SIZE_FACTOR)
+
+    def start(self, processes: Optional[int] = None) -> "Blaster":
+        """Start a persistent pool of worker processes.
+
+        The workers and their queues stay alive between blastoff calls until
+        shutdown is called, saving the cost of creating new processes for
+        every batch of tasks.
+
+        :param processes: number of worker processes to start (defaults to
+            the blaster sizing policy)
+        :return: blaster object
+        """
+        if self.running:
+            return self
+
+        if processes is None:
+            processes = self.policy_processes()
+
+        self._pool_task_queue = multiprocessing.Queue(
+            self.total_queue_size(processes)
+        )
+        self._pool_complete_queue = multiprocessing.Queue()
+        self._processes = self._spawn_processes(
+            processes, self._pool_task_queue, self._pool_complete_queue
         )
+        self.logger.info("Started worker pool with %s processes." % processes)
+        return self
 
-        # Initialize queues based on execution type
-        if serial:
-            self.task_queue = queue.Queue()
-            self.task_complete_queue = queue.Queue()
-        else:
-            self.task_queue = multiprocessing.Queue()
-            self.task_complete_queue = multiprocessing.Queue()
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Stop the persistent pool of worker processes.
+
+        :param timeout: seconds to wait for each process to exit before it
+            is terminated
+        """
+        if not self.running:
+            return
+
+        for p in self._processes:
+            self._pool_task_queue.put("STOP")  # type: ignore
+        for p in self._processes:
+            p.join(timeout)
+            if p.is_alive():
+                self.logger.error("Terminating child process: %s" % p.name)
+                p.terminate()
+                p.join(2)
+
+        self._processes = []
+        self._pool_task_queue = None
+        self._pool_complete_queue = None
+        self._pool_pending.clear()
+        self.logger.info("Worker pool shutdown.")
+
+    def _shrink_pool(self) -> None:
+        """Stop idle autoscaled pool workers, keeping the policy minimum."""
+        if self.processes != "autoscale":
+            return
+
+        self._processes = [p for p in self._processes if p.is_alive()]
+        extra: int = len(self._processes) - self.policy_processes()
+        if extra > 0:
+            self.logger.debug("Autoscaling, stopping %s idle processes" % extra)
+            for i in range(extra):
+                self._pool_task_queue.put("STOP")  # type: ignore
+
+    @staticmethod
+    def _spawn_processes(
+        count: int,
+        task_queue: multiprocessing.Queue,
+        task_complete_queue: multiprocessing.Queue,
+    ) -> List[multiprocessing.Process]:
+        """Create and start worker processes reading from the given queues.
+
+        :param count: number of processes to start
+        :param task_queue: the queue containing the tasks to process
+        :param task_complete_queue: the queue to put processed tasks on
+        :return: started processes
+        """
+        worker: Worker = Worker()
+        processes: List[multiprocessing.Process] = []
+        for i in range(count):
+            processes.append(
+                multiprocessing.Process(
+                    target=worker.run,
+                    args=(task_queue, task_complete_queue, False),
+                )
+            )
+
+        for p in processes:
+            p.start()
+        return processes
+
+    def _autoscale(
+        self,
+        processes: List[multiprocessing.Process],
+        task_queue: multiprocessing.Queue,
+        task_complete_queue: multiprocessing.Queue,
+    ) -> None:
+        """Grow the worker processes when they fall behind the task backlog.
+
+        More workers are started when the backlog did not drain since the
+        previous check, doubling the workers at most each time.
+
+        :param processes: worker processes, extended in place
+        :param task_queue: the queue containing the tasks to process
+        :param task_complete_queue: the queue to put processed tasks on
+        """
+        if self.processes != "autoscale":
+            return
+
+        try:
+            backlog: int = task_queue.qsize()
+        except NotImplementedError:
+            # Not supported on every platform (e.g. macOS)
+            return
+
+        last_backlog, self._last_backlog = self._last_backlog, backlog
+        if backlog == 0 or (last_backlog is not None and backlog < last_backlog):
+            return
+
+        alive: int = len([p for p in processes if p.is_alive()])
+        count: int = min(backlog, self.max_processes - alive, max(1, alive))
+        if count > 0:
+            self.logger.debug(
+                "Autoscaling, starting %s more processes (backlog: %s)"
+                % (count, backlog)
+            )
+            processes.extend(
+                self._spawn_processes(count, task_queue, task_complete_queue)
+            )
+
+    def _next_result(
+        self,
+        processes: List[multiprocessing.Process],
+        task_queue: multiprocessing.Queue,
+        task_complete_queue: multiprocessing.Queue,
+        timeout: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Wait for the next processed task from the completion queue.
+
+        Workers are autoscaled every interval spent waiting.
+
+        :param processes: worker processes
+        :param task_queue: the queue containing the tasks to process
+        :param task_complete_queue: the queue to get processed tasks from
+        :param timeout: seconds to wait before returning none
+        :return: processed task
+        """
+        deadline: Optional[float] = (
+            None if timeout is None else time.monotonic() + timeout
+        )
+        while True:
+            wait: float = AUTOSCALE_INTERVAL
+            if deadline is not None:
+                wait = min(wait, max(0.0, deadline - time.monotonic()))
+            try:
+                return task_complete_queue.get(timeout=wait)
+            except queue.Empty:
+                self._autoscale(processes, task_queue, task_complete_queue)
+                if deadline is not None and time.monotonic() >= deadline:
+                    return None
+
+    def _iter_pooled(self, feeder: TaskFeeder) -> Iterator[Dict[str, Any]]:
+        """Yield this runs results from the shared pool completion queue.
+
+        Results belonging to other blastoff calls sharing the pool are held
+        aside until their caller collects them.
+
+        :param feeder: the feeder of this runs tasks
+        """
+        while not feeder.finished():
+            found: List[Dict[str, Any]] = []
+            with self._pool_lock:
+                for bid in [b for b in self._pool_pending if b in feeder.pending]:
+                    found.append(self._pool_pending.pop(bid))
+                if not found:
+                    result = self._next_result(
+                        self._processes,
+                        self._pool_task_queue,  # type: ignore
+                        self._pool_complete_queue,  # type: ignore
+                        timeout=0.1,
+                    )
+                    if result is None:
+                        continue
+                    if result["bid"] in feeder.pending:
+                        found.append(result)
+                    else:
+                        self._pool_pending[result["bid"]] = result
+            for result in found:
+                feeder.received(result)
+                yield result
+
+    def _iter_serial(self) -> Iterator[Dict[str, Any]]:
+        """Process the tasks sequentially, yielding results.
+
+        Once a task fails, the remaining tasks are not run.
+        """
+        worker: Worker = Worker()
+        tasks: Iterator[Dict[str, Any]] = iter(self.tasks)
 
         self.logger.info("Tasks:")
-        for index, task in enumerate(self.tasks, start=1):
+        for index, task in enumerate(tasks, start=1):
             task = TaskDefinition(task)  # type: ignore
             self.logger.info(
                 """%s. Task     : %s
@@ -221,65 +738,257 @@ class Blaster(CalcTimeMixin, LoggerMixin):
                                 Methods  : %s"""
                 % (index, task["name"], task["task"], task["methods"])
             )
-            self.task_queue.put(task)
+            exception_type: str = worker.process_task(task)
+            yield task
+
+            if exception_type:
+                for task in tasks:
+                    yield worker.skip_task(TaskDefinition(task))  # type: ignore
+                break
+
+    def _iter_processes(
+        self, feeder: TaskFeeder, workers: int, pooled: bool
+    ) -> Iterator[Dict[str, Any]]:
+        """Process the fed tasks with worker processes, yielding results.
+
+        :param feeder: the feeder of the tasks
+        :param workers: number of worker processes to start
+        :param pooled: whether to use the persistent worker pool
+        """
+        processes: List[multiprocessing.Process]
+        if pooled:
+            processes = self._processes
+        else:
+            processes = self._spawn_processes(
+                workers, self.task_queue, self.task_complete_queue
+            )
+
+        completed: bool = False
+        try:
+            self._last_backlog = None
+            if pooled:
+                yield from self._iter_pooled(feeder)
+                self._shrink_pool()
+            else:
+                while not feeder.finished():
+                    result = self._next_result(
+                        processes,
+                        self.task_queue,
+                        self.task_complete_queue,
+                        timeout=0.1,
+                    )
+                    if result is not None:
+                        feeder.received(result)
+                        yield result
+            completed = True
+        except KeyboardInterrupt:
+            feeder.cancel()
+            self.logger.warning(
+                "Delaying 15 seconds to allow worker processes to flush "
+                "out any remaining items in the queue."
+            )
+            time.sleep(15)
+
+            while not self.task_complete_queue.empty():
+                yield self.task_complete_queue.get()
+
+            for p in processes:
+                self.task_queue.put("STOP")
+
+            for p in processes:
+                self.logger.error("Terminating child process: %s" % p.name)
+                p.terminate()
+                p.join(2)
+            self.logger.error("All child processes were terminated.")
+
+            # The pool can not be reused once its processes are gone
+            if pooled:
+                self._processes = []
+        finally:
+            # Results iterator closed early, workers are no longer needed
+            if not completed:
+                feeder.cancel()
+                if not pooled:
+                    for p in processes:
+                        if p.is_alive():
+                            p.terminate()
+
+    def _iter_threads(
+        self, feeder: TaskFeeder, workers: int
+    ) -> Iterator[Dict[str, Any]]:
+        """Process the fed tasks with a pool of worker threads.
+
+        :param feeder: the feeder of the tasks
+        :param workers: number of worker threads to start
+        """
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="blaster"
+        ) as executor:
+            futures: List[Future] = [
+                executor.submit(
+                    Worker().run, self.task_queue, self.task_complete_queue, False
+                )
+                for i in range(workers)
+            ]
+            yield from self._iter_completed(feeder, futures)
+
+    def _iter_asyncio(
+        self, feeder: TaskFeeder, workers: int
+    ) -> Iterator[Dict[str, Any]]:
+        """Process the fed tasks with worker coroutines in an event loop.
+
+        The event loop runs in its own thread to yield results as they come.
+
+        :param feeder: the feeder of the tasks
+        :param workers: number of worker coroutines to run
+        """
+
+        async def run() -> None:
+            """Run all worker coroutines."""
+            await asyncio.gather(
+                *[
+                    Worker().run_async(
+                        self.task_queue, self.task_complete_queue  # type: ignore
+                    )
+                    for i in range(workers)
+                ]
+            )
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="blaster") as e:
+            yield from self._iter_completed(feeder, [e.submit(asyncio.run, run())])
+
+    def _iter_completed(
+        self, feeder: TaskFeeder, futures: List[Future]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield processed tasks from the completion queue as they come.
+
+        :param feeder: the feeder of the tasks
+        :param futures: futures of the running workers, stops waiting for
+            more processed tasks once all are done (e.g. after an interrupt)
+        """
+        try:
+            while not feeder.finished():
+                try:
+                    result = self.task_complete_queue.get(timeout=0.1)
+                except queue.Empty:
+                    done: bool = all(f.done() for f in futures)
+                    if done and self.task_complete_queue.empty():
+                        break
+                    continue
+                feeder.received(result)
+                yield result
+        finally:
+            feeder.cancel()
+            # Let the workers exit once the queued tasks are processed
+            for f in futures:
+                self.task_queue.put("STOP")
+
+    @staticmethod
+    def _ordered(
+        results: Iterator[Dict[str, Any]], order: Deque[str]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield results in the order their tasks were given.
+
+        :param results: results in completion order
+        :param order: blaster ids of the tasks in the order given, consumed
+            as results are yielded
+        """
+        pending: Dict[str, Dict[str, Any]] = {}
+        for result in results:
+            pending[result["bid"]] = result
+            while order and order[0] in pending:
+                yield pending.pop(order.popleft())
+        # Any results left behind (e.g. after an interrupt)
+        for bid in order:
+            if bid in pending:
+                yield pending.pop(bid)
+
+    def blast_iter(
+        self,
+        serial: bool = False,
+        tasks: Optional[Iterable[Dict[str, Any]]] = None,
+        engine: Optional[str] = None,
+        ordered: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Blast off tasks yielding each task result as soon as it completes.
+
+        Unlike blastoff, results are not kept in memory by blaster. Tasks may
+        be any iterable (e.g. a generator), they are fed to the workers
+        through a bounded queue as workers make room for them.
+
+        :param serial: whether to run tasks sequentially
+        :param tasks: tasks to process, replacing the ones given at creation
+        :param engine: execution engine to run the tasks with, one of serial,
+            process, thread or asyncio (defaults to serial or process based
+            on the serial parameter)
+        :param ordered: whether to yield results in the order the tasks were
+            given instead of the order they completed
+        :return: results iterator
+        """
+        if engine is None:
+            engine = "serial" if serial else "process"
+        if engine not in ENGINES:
+            raise BlasterError(f"Invalid engine: '{engine}', choose from: {ENGINES}")
+        serial = engine == "serial"
+
+        if tasks is not None:
+            self.tasks = tasks
+
+        pooled: bool = engine == "process" and self.running
+
+        self.logger.info("--> Blaster v%s <--" % __version__)
+        self.logger.info(
+            "Task Execution: %s (%s)"
+            % ("Sequential" if serial else "Concurrent", engine)
+        )
 
         # Save start time
         self.start_time()
 
         self.logger.info("** BLASTER BEGIN **")
 
-        worker: Worker = Worker()
+        results: Iterator[Dict[str, Any]]
         if serial:
-            worker.run(self.task_queue, self.task_complete_queue, serial)
+            # Sequential runs process each task as it is taken from the tasks
+            results = self._iter_serial()
         else:
-            # Determine the number of processes to use
-            processes_count: int = self.total_processes()
-
-            # Build processes
-            processes: List[multiprocessing.Process] = []
-            for i in range(processes_count):
-                processes.append(
-                    multiprocessing.Process(
-                        target=worker.run,
-                        args=(self.task_queue, self.task_complete_queue, serial),
-                    )
-                )
+            workers: int = max(1, self.total_processes())
 
-            # Start processes
-            for p in processes:
-                p.start()
-
-            try:
-                for i in range(len(self.tasks)):
-                    self.results.append(self.task_complete_queue.get())
-                for i in range(processes_count):
-                    self.task_queue.put("STOP")
-            except KeyboardInterrupt:
-                self.logger.warning(
-                    "Delaying 15 seconds to allow worker processes to flush "
-                    "out any remaining items in the queue."
+            # Initialize queues based on execution type
+            if engine != "process":
+                self.task_queue = queue.Queue(self.total_queue_size(workers))
+                self.task_complete_queue = queue.Queue()
+            elif pooled:
+                self.task_queue = self._pool_task_queue  # type: ignore
+                self.task_complete_queue = self._pool_complete_queue  # type: ignore
+            else:
+                self.task_queue = multiprocessing.Queue(
+                    self.total_queue_size(workers)
                 )
-                time.sleep(15)
+                self.task_complete_queue = multiprocessing.Queue()
 
-                while not self.task_complete_queue.empty():
-                    self.results.append(self.task_complete_queue.get())
+            feeder: TaskFeeder = TaskFeeder(
+                self.tasks,
+                self.task_queue,
+                stops=0 if pooled else workers,
+                ordered=ordered,
+            ).start()
 
-                for i in range(processes_count):
-                    self.task_queue.put("STOP")
+            if engine == "thread":
+                results = self._iter_threads(feeder, workers)
+            elif engine == "asyncio":
+                results = self._iter_asyncio(feeder, workers)
+            else:
+                results = self._iter_processes(feeder, workers, pooled)
 
-                for p in processes:
-                    self.logger.error("Terminating child process: %s" % p.name)
-                    p.terminate()
-                    p.join(2)
-                self.logger.error("All child processes were terminated.")
+            if ordered:
+                results = self._ordered(results, feeder.order)  # type: ignore
+
+        yield from results
 
         # Save end time
         self.end_time()
 
-        # Get tasks and their results
-        while not self.task_complete_queue.empty():
-            self.results.append(self.task_complete_queue.get())
-
         # Calculate time delta
         hour, minutes, seconds = self.time_delta()
         self.logger.info("** BLASTER COMPLETE **")
@@ -287,6 +996,31 @@ class Blaster(CalcTimeMixin, LoggerMixin):
             "    -> TOTAL DURATION: %dh:%dm:%ds" % (hour, minutes, seconds)
         )
 
+    def blastoff(
+        self,
+        serial: bool = False,
+        raise_on_failure: bool = False,
+        tasks: Optional[Iterable[Dict[str, Any]]] = None,
+        engine: Optional[str] = None,
+    ) -> List[Dict[str, int]]:
+        """Blast off tasks concurrently or sequentially calling their defined
+                methods.
+
+        When the persistent worker pool is running (see start), concurrent
+        runs reuse its processes instead of creating new ones.
+
+        :param serial: whether to run tasks sequentially
+        :param raise_on_failure: whether to raise exception on failure
+        :param tasks: tasks to process, replacing the ones given at creation
+        :param engine: execution engine to run the tasks with, one of serial,
+            process, thread or asyncio (defaults to serial or process based
+            on the serial parameter)
+        :return: content from task method calls
+        """
+        self.results = ResultsList()
+        for result in self.blast_iter(serial=serial, tasks=tasks, engine=engine):
+            self.results.append(result)
+
         # Determine how to return results based on users input
         if raise_on_failure and self.results.analyze():
             raise BlasterError(
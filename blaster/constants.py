@@ -10,7 +10,17 @@ from logging import WARNING
 from typing import Dict
 from typing import List
 
-__all__: List[str] = ["LOG_LEVELS", "LOG_FORMAT", "REQ_TASK_KEYS"]
+__all__: List[str] = [
+    "LOG_LEVELS",
+    "LOG_FORMAT",
+    "REQ_TASK_KEYS",
+    "DEFAULT_PROCESSES",
+    "AUTOSCALE_FACTOR",
+    "PROCESS_POLICIES",
+    "AUTOSCALE_INTERVAL",
+    "ENGINES",
+    "QUEUE_SIZE_FACTOR",
+]
 
 LOG_LEVELS: Dict[str, int] = {
     "debug": DEBUG,
@@ -23,3 +33,19 @@ LOG_LEVELS: Dict[str, int] = {
 LOG_FORMAT: str = "%(asctime)s %(levelname)s %(message)s"
 
 REQ_TASK_KEYS: List[str] = ["name", "task", "methods"]
+
+# Worker process count used when no sizing policy is given
+DEFAULT_PROCESSES: int = 10
+
+# Autoscaling may grow the worker count up to this many workers per cpu
+AUTOSCALE_FACTOR: int = 4
+
+PROCESS_POLICIES: List[str] = ["cpu", "autoscale"]
+
+# Seconds between checks of the task backlog when autoscaling
+AUTOSCALE_INTERVAL: float = 0.5
+
+ENGINES: List[str] = ["serial", "process", "thread", "asyncio"]
+
+# Tasks waiting in the task queue per worker, bounding memory used by tasks
+QUEUE_SIZE_FACTOR: int = 2
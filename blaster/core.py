@@ -2,6 +2,7 @@
 
 The core module contains commonly used classes and functions by blaster.
 """
+import os
 from inspect import getmodule
 from inspect import stack
 from logging import Formatter
@@ -26,9 +27,45 @@ __all__: List[str] = [
     "LoggerMixin",
     "TaskDefinition",
     "ResultsList",
+    "available_cpus",
 ]
 
 
+def available_cpus() -> int:
+    """Return the number of cpus this process is allowed to use.
+
+    Takes into account the cpu affinity of the process along with any cgroup
+    (v1 or v2) cpu quota set, e.g. when running inside a container.
+
+    :return: number of usable cpus (at least one)
+    """
+    try:
+        count: int = len(os.sched_getaffinity(0))  # type: ignore
+    except AttributeError:
+        count = os.cpu_count() or 1
+
+    quota: Optional[float] = None
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            limit, period = f.read().split()[:2]
+            if limit != "max":
+                quota = int(limit) / int(period)
+    except (OSError, ValueError):
+        try:
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+                limit = f.read().strip()
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+                period = f.read().strip()
+            if int(limit) > 0:
+                quota = int(limit) / int(period)
+        except (OSError, ValueError):
+            pass
+
+    if quota is not None:
+        count = min(count, max(1, int(quota)))
+    return max(1, count)
+
+
 class LoggerMixin:
     """Blaster's logger class to handle configuring loggers."""
 
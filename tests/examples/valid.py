@@ -2,6 +2,7 @@
 
 Valid classes used by blaster tests.
 """
+import asyncio
 from logging import getLogger
 from time import sleep
 
@@ -26,3 +27,23 @@ class ValidCar(object):
         """Build the car's interior."""
         LOG.info("Build interior.")
         sleep(1)
+
+
+class ValidAsyncCar(object):
+    """Build a valid car using coroutines."""
+
+    def __init__(self, **kwargs):
+        """Constructor."""
+        pass
+
+    @staticmethod
+    async def exterior():
+        """Build the car's exterior."""
+        LOG.info("Build exterior.")
+        await asyncio.sleep(1)
+
+    @staticmethod
+    async def interior():
+        """Build the car's interior."""
+        LOG.info("Build interior.")
+        await asyncio.sleep(1)
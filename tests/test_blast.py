@@ -7,6 +7,7 @@ import pytest
 from blaster import Blaster
 from blaster import BlasterError
 from tests.examples.invalid import InvalidCar
+from tests.examples.valid import ValidAsyncCar
 from tests.examples.valid import ValidCar
 
 
@@ -133,3 +134,165 @@ class TestBlast(object):
             )
         blaster = Blaster(tasks=tasks)
         blaster.blastoff()
+
+    @staticmethod
+    def test_blastoff_persistent_pool():
+        """Run multiple blaster blastoff calls reusing a worker pool.
+
+        This method tests the blaster pool keeps the same worker processes
+        alive between blastoff calls and returns each runs results.
+        (positive test)
+        """
+        tasks = [{"name": "car", "task": ValidCar, "methods": ["exterior"]}]
+        with Blaster(log_level="debug") as blaster:
+            pids = [p.pid for p in blaster._processes]
+            first = blaster.blastoff(tasks=tasks)
+            second = blaster.blastoff(tasks=tasks + tasks)
+            assert pids == [p.pid for p in blaster._processes]
+        assert len(first) == 1
+        assert len(second) == 2
+        assert not blaster.running
+
+    @staticmethod
+    def test_blaster_processes_policy():
+        """Determine the number of processes from the sizing policy.
+
+        This method tests the blaster processes sizing policies. (positive
+        test)
+        """
+        tasks = [{"name": "car", "task": ValidCar, "methods": ["exterior"]}] * 4
+        assert Blaster(tasks=tasks).total_processes() == 4
+        assert Blaster(tasks=tasks, processes=2).total_processes() == 2
+        assert Blaster(tasks=tasks, processes="cpu").total_processes() >= 1
+        assert Blaster(tasks=tasks, processes="autoscale").total_processes() == 1
+
+    @staticmethod
+    def test_blaster_invalid_processes_policy():
+        """Create a blaster object with an invalid sizing policy.
+
+        This method tests creating a blaster object with an invalid processes
+        policy. (negative test)
+        """
+        with pytest.raises(BlasterError):
+            Blaster(list(), processes="many")
+        with pytest.raises(BlasterError):
+            Blaster(list(), processes=0)
+
+    @staticmethod
+    def test_blastoff_parallel_autoscale():
+        """Run blaster blastoff method autoscaling the processes.
+
+        This method tests the blaster blastoff method grows the worker
+        processes while tasks are waiting in the queue. (positive test)
+        """
+        tasks = [{"name": "car", "task": ValidCar, "methods": ["exterior"]}] * 6
+        blaster = Blaster(tasks=tasks, processes="autoscale", max_processes=3)
+        results = blaster.blastoff()
+        assert len(results) == 6
+        assert results.analyze() == 0
+
+    @staticmethod
+    def test_valid_blastoff_thread():
+        """Run blaster blastoff method with valid tasks in threads.
+
+        This method tests the blaster blastoff method using the thread engine.
+        (positive test)
+        """
+        tasks = [{"name": "car", "task": ValidCar, "methods": ["exterior"]}] * 3
+        results = Blaster(tasks=tasks).blastoff(engine="thread")
+        assert len(results) == 3
+        assert results.analyze() == 0
+
+    @staticmethod
+    def test_blastoff_thread_failure():
+        """Run blaster blastoff method with a task raising a failure in threads.
+
+        This method tests the blaster blastoff method using the thread engine
+        with a task raising an exception. (negative test)
+        """
+        with pytest.raises(BlasterError):
+            blaster = Blaster(
+                tasks=[{"name": "car", "task": InvalidCar, "methods": ["exterior"]}]
+            )
+            blaster.blastoff(engine="thread", raise_on_failure=True)
+
+    @staticmethod
+    def test_valid_blastoff_asyncio():
+        """Run blaster blastoff method with valid tasks in an event loop.
+
+        This method tests the blaster blastoff method using the asyncio engine
+        with both coroutine and regular task methods. (positive test)
+        """
+        tasks = [
+            {"name": "car", "task": ValidAsyncCar, "methods": ["exterior"]},
+            {"name": "car", "task": ValidAsyncCar, "methods": ["interior"]},
+            {"name": "car", "task": ValidCar, "methods": ["exterior"]},
+        ]
+        results = Blaster(tasks=tasks).blastoff(engine="asyncio")
+        assert len(results) == 3
+        assert results.analyze() == 0
+
+    @staticmethod
+    def test_blastoff_asyncio_failure():
+        """Run blaster blastoff method with a task raising a failure in an
+        event loop.
+
+        This method tests the blaster blastoff method using the asyncio engine
+        with a task raising an exception. (negative test)
+        """
+        with pytest.raises(BlasterError):
+            blaster = Blaster(
+                tasks=[{"name": "car", "task": InvalidCar, "methods": ["exterior"]}]
+            )
+            blaster.blastoff(engine="asyncio", raise_on_failure=True)
+
+    @staticmethod
+    def test_blastoff_invalid_engine():
+        """Run blaster blastoff method with an invalid engine.
+
+        This method tests the blaster blastoff method. (negative test)
+        """
+        with pytest.raises(BlasterError):
+            Blaster(list()).blastoff(engine="rocket")
+
+    @staticmethod
+    def test_blast_iter_unordered():
+        """Iterate over blaster results as tasks complete.
+
+        This method tests the blaster blast iter method yields every task
+        result. (positive test)
+        """
+        tasks = [
+            {"name": "car %s" % i, "task": ValidCar, "methods": ["exterior"]}
+            for i in range(3)
+        ]
+        results = list(Blaster(tasks=tasks).blast_iter(engine="thread"))
+        assert sorted(r["name"] for r in results) == ["car 0", "car 1", "car 2"]
+
+    @staticmethod
+    def test_blast_iter_ordered():
+        """Iterate over blaster results in the order tasks were given.
+
+        This method tests the blaster blast iter method yields the task
+        results in order. (positive test)
+        """
+        tasks = [
+            {"name": "car 0", "task": ValidCar, "methods": ["exterior", "interior"]},
+            {"name": "car 1", "task": ValidCar, "methods": ["exterior"]},
+        ]
+        results = Blaster(tasks=tasks).blast_iter(ordered=True)
+        assert [r["name"] for r in results] == ["car 0", "car 1"]
+
+    @staticmethod
+    def test_blast_iter_serial_failure():
+        """Iterate over blaster results sequentially with a failing task.
+
+        This method tests the blaster blast iter method yields the failed task
+        followed by the tasks not run. (negative test)
+        """
+        tasks = [
+            {"name": "car 0", "task": InvalidCar, "methods": ["exterior"]},
+            {"name": "car 1", "task": ValidCar, "methods": ["exterior"]},
+        ]
+        results = list(Blaster(tasks=tasks).blast_iter(serial=True))
+        assert [r["status"] for r in results] == [1, "n/a"]
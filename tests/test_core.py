@@ -10,6 +10,7 @@ from blaster.core import BlasterError
 from blaster.core import CalcTimeMixin
 from blaster.core import LoggerMixin
 from blaster.core import ResultsList
+from blaster.core import available_cpus
 from blaster.core import TaskDefinition
 
 
@@ -164,3 +165,15 @@ class TestResultsList(object):
         res = ResultsList()
         res.append(dict(name="item1", status=1))
         assert res.analyze() == 1
+
+
+class TestAvailableCpus(object):
+    """Unit tests to cover blaster available cpus function."""
+
+    @staticmethod
+    def test_available_cpus():
+        """Get the number of available cpus.
+
+        This method tests the number of available cpus is a positive number.
+        """
+        assert available_cpus() >= 1